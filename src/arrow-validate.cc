@@ -1,6 +1,6 @@
-#include <cmath>
 #include <memory>
 #include <string>
+#include <vector>
 
 #include <arrow/api.h>
 #include <arrow/compute/api.h>
@@ -11,6 +11,7 @@
 #include <gflags/gflags.h>
 
 #include "common.h"
+#include "string-view-hash-map.h"
 
 DEFINE_bool(check_safe, true, "Ensure all utf8() and dictionary(..., utf8()) offsets don't overflow data buffers, utf8 is all valid, plus other built-in Arrow tests");
 DEFINE_bool(check_floats_all_finite, false, "Ensure all float16, float32 and float64 values are finite (not NaN or Infinity)");
@@ -32,42 +33,41 @@ struct CheckDictionaryValuesAllUsedVisitor {
 
   template<typename ArrayType>
   bool check(const ArrayType& indices) {
-    if (indices.null_count() == indices.length()) {
-      // all-null indices? Then length of non-null data must be 0
-      return this->dictionary->length() == 0;
-    }
-
-    using value_type = typename ArrayType::value_type;
-
-    // 1. Find max
-    value_type max = 0;
+    // 1. Mark each used dictionary index in a bitmap sized to the dictionary.
+    // Out-of-range indices (--check-safe's job) mark nothing.
+    const uint64_t dictionaryLength = this->dictionary->length();
+    std::vector<uint64_t> used((dictionaryLength + 63) / 64, 0);
+    const typename ArrayType::value_type* values = indices.raw_values();
     int64_t length = indices.length();
-    for (int64_t i = 0; i < length; i++) {
-      if (indices.IsValid(i)) {
-        value_type value = indices.Value(i);
-        if (value > max) {
-          max = value;
+    if (indices.null_count() == 0) {
+      for (int64_t i = 0; i < length; i++) {
+        uint64_t value = static_cast<uint64_t>(static_cast<int64_t>(values[i])); // negative => huge
+        if (value < dictionaryLength) {
+          used[value >> 6] |= uint64_t(1) << (value & 63);
         }
       }
-    }
-
-    // 2. Store all seen values in a set. (The set is of size `max`.)
-    // 0 means "not seen", 1 means "seen"
-    std::unique_ptr<uint8_t[]> seen = std::make_unique<uint8_t[]>(max + 1);
-    for (int64_t i = 0; i < length; i++) {
-      if (indices.IsValid(i)) {
-        seen[indices.Value(i)] = 1;
+    } else {
+      for (int64_t i = 0; i < length; i++) {
+        uint64_t value = static_cast<uint64_t>(static_cast<int64_t>(values[i]));
+        if (value < dictionaryLength && indices.IsValid(i)) {
+          used[value >> 6] |= uint64_t(1) << (value & 63);
+        }
       }
     }
 
-    // 3. Check if there's an unseen value.
-    for (int64_t i = 0; i < max; i++) {
-      if (seen[i] == 0) {
+    // 2. Check every dictionary value was marked, 64 at a time.
+    uint64_t nFullWords = dictionaryLength / 64;
+    for (uint64_t w = 0; w < nFullWords; w++) {
+      if (used[w] != ~uint64_t(0)) {
         return false;
       }
     }
+    uint64_t nTrailingBits = dictionaryLength % 64;
+    if (nTrailingBits != 0 && used[nFullWords] != (uint64_t(1) << nTrailingBits) - 1) {
+      return false;
+    }
 
-    // We've seen all value
+    // We've seen all values
     return true;
   }
 
@@ -107,9 +107,36 @@ checkDictionaryValuesAllUsed(const arrow::Array& indices, const arrow::Array& di
 }
 
 
+static bool
+checkStringDictionaryValuesUnique(const arrow::StringArray& dictionary)
+{
+  // Unlike compute::Unique(), stop at the first duplicate and don't build
+  // an output array.
+  int64_t length = dictionary.length();
+  StringViewHashMap<bool> seen(length);
+  bool seenNull = false;
+  for (int64_t i = 0; i < length; i++) {
+    if (dictionary.IsNull(i)) {
+      if (seenNull) return false;
+      seenNull = true;
+    } else {
+      int32_t valueLength;
+      const uint8_t* value = dictionary.GetValue(i, &valueLength);
+      std::string_view sv(reinterpret_cast<const char*>(value), valueLength);
+      if (!seen.insert(sv, true).second) return false;
+    }
+  }
+  return true;
+}
+
+
 static bool
 checkDictionaryValuesUnique(const std::shared_ptr<arrow::Array> dictionary)
 {
+  if (dictionary->type_id() == arrow::Type::STRING) {
+    return checkStringDictionaryValuesUnique(static_cast<const arrow::StringArray&>(*dictionary));
+  }
+
   arrow::compute::ExecContext ctx;
   ctx.set_use_threads(false);
   std::shared_ptr<arrow::Array> uniques = ASSERT_ARROW_OK(
@@ -120,18 +147,62 @@ checkDictionaryValuesUnique(const std::shared_ptr<arrow::Array> dictionary)
 }
 
 
+/**
+ * Bit patterns of a float type: NaN and +/-Infinity are exactly the values
+ * whose exponent bits are all 1.
+ */
+template<typename ArrayType> struct FloatBits;
+
+template<> struct FloatBits<arrow::HalfFloatArray> {
+  using type = uint16_t;
+  static constexpr type exponentMask = 0x7c00;
+};
+
+template<> struct FloatBits<arrow::FloatArray> {
+  using type = uint32_t;
+  static constexpr type exponentMask = 0x7f800000;
+};
+
+template<> struct FloatBits<arrow::DoubleArray> {
+  using type = uint64_t;
+  static constexpr type exponentMask = 0x7ff0000000000000;
+};
+
+
+template<typename ArrayType>
+static bool
+hasValidNonFiniteValue(const ArrayType& array)
+{
+  using Bits = FloatBits<ArrayType>;
+  const typename Bits::type* values = array.data()->template GetValues<typename Bits::type>(1);
+  int64_t length = array.length();
+
+  // Fast path: test every value's exponent -- null or not -- and OR the
+  // results instead of returning early. No branches, so the compiler
+  // vectorizes this loop.
+  bool any = false;
+  for (int64_t i = 0; i < length; i++) {
+    any |= (values[i] & Bits::exponentMask) == Bits::exponentMask;
+  }
+  if (!any) return false;
+
+  // Slow path: we found NaN or Infinity. Is it in a non-null slot?
+  for (int64_t i = 0; i < length; i++) {
+    if ((values[i] & Bits::exponentMask) == Bits::exponentMask && array.IsValid(i)) {
+      return true;
+    }
+  }
+  return false;
+}
+
+
 struct ValidateVisitor {
   template<typename ArrayType>
   arrow::Status visitFloatArray(const ArrayType& array)
   {
     if (FLAGS_check_floats_all_finite) {
-      int64_t length = array.length();
-      for (int64_t i = 0; i < length; i++) {
-        if (array.IsValid(i)) {
-          if (!std::isfinite(array.Value(i))) {
-            return arrow::Status::Invalid("--check-floats-all-finite");
-          }
-        }
+      if (hasValidNonFiniteValue(array)) {
+        return arrow::Status::Invalid("--check-floats-all-finite");
       }
     }
     return arrow::Status::OK();
@@ -218,11 +289,15 @@ validateColumnName(const std::string& name)
   }
 
   if (FLAGS_check_column_name_control_characters) {
+    // No early exit: OR-reducing over the whole name lets the compiler
+    // vectorize the loop.
+    bool hasControlCharacter = false;
     for (const uint8_t c : name) {
-      if (c < 0x20) {
-        std::cout << "--check-column-name-control-characters failed on a column name" << std::endl;
-        return false;
-      }
+      hasControlCharacter |= c < 0x20;
+    }
+    if (hasControlCharacter) {
+      std::cout << "--check-column-name-control-characters failed on a column name" << std::endl;
+      return false;
     }
   }
 
@@ -238,10 +313,20 @@ validateColumnName(const std::string& name)
 
 
 static bool
-validateColumn(const std::string& name, const arrow::Array& array)
+validateColumnNames(const arrow::Schema& schema)
 {
-  if (!validateColumnName(name)) return false;
+  // Column names live in the schema, so we check them once per file -- not
+  // once per record batch.
+  for (const std::string& name : schema.field_names()) {
+    if (!validateColumnName(name)) return false;
+  }
+  return true;
+}
+
 
+static bool
+validateColumn(const std::string& name, const arrow::Array& array)
+{
   arrow::Status status = validateArray(array);
   if (status.IsInvalid()) {
     std::cout << status.message() << " failed on column " << name << std::endl;
@@ -286,6 +371,10 @@ validateArrowFile(const std::string& filename)
     "reading Arrow file header"
   );
 
+  if (!validateColumnNames(*reader->schema())) {
+    return false;
+  }
+
   int nBatches = reader->num_record_batches();
   for (int i = 0; i < nBatches; i++) {
     std::shared_ptr<arrow::RecordBatch> batch = ASSERT_ARROW_OK(
@@ -1,5 +1,5 @@
-#include <charconv>
 #include <cmath> // std::isfinite()
+#include <cstring> // memcpy()
 
 #include "column-builder.h"
 #include "common.h"
@@ -87,32 +87,73 @@ ColumnBuilder::writeString(int64_t row, std::string_view str)
 }
 
 
+static inline bool
+isEightDigits(uint64_t chunk)
+{
+    // Each byte must be 0x30-0x39: high nibble 3, and adding 6 mustn't carry
+    return ((chunk & 0xf0f0f0f0f0f0f0f0) | (((chunk + 0x0606060606060606) & 0xf0f0f0f0f0f0f0f0) >> 4)) == 0x3333333333333333;
+}
+
+
+static inline uint32_t
+parseEightDigits(uint64_t chunk)
+{
+    // SWAR: combine digit pairs, then pairs of pairs, then the two halves.
+    // Assumes the first digit is in the lowest byte.
+    chunk -= 0x3030303030303030;
+    chunk = (chunk * 10) + (chunk >> 8);
+    return (((chunk & 0x000000ff000000ff) * 0x000f424000000064)
+            + (((chunk >> 16) & 0x000000ff000000ff) * 0x0000271000000001)) >> 32;
+}
+
+
+/**
+ * Parse a JSON number as int64, if it is an int64.
+ *
+ * JSON number format is blissfully restrictive: no leading "+" or 0, no
+ * whitespace. Anything with a "." or "e" is a float (even "1.0"), and so is
+ * anything outside int64 range.
+ */
 static bool
-canParseJsonNumberAsInt64(std::string_view str)
+parseJsonNumberAsInt64(std::string_view str, int64_t* value)
 {
-    // JSON number format is blissfully restrictive: no leading "+" or 0,
-    // no whitespace. We can pick a parser simply by examining str.
-    const static std::string minInt64String = std::to_string(std::numeric_limits<int64_t>::min());
-    const static std::string maxInt64String = std::to_string(std::numeric_limits<int64_t>::max());
-    return (
-        // we always parse exponential notation as float.
-        // (And of course, decimals are floats.)
-        (str.find_first_of(".eE") == std::string_view::npos)
-        // magic numbers differ for negative and positive numbers
-        && (
-            str[0] == '-' ? (
-                // few enough digits it's certainly int64
-                str.size() < minInt64String.size()
-                // same length and lexicographically smaller
-                || (str.size() == minInt64String.size() && str <= minInt64String)
-            ) : (
-                // few enough digits it's certainly int64
-                str.size() < maxInt64String.size()
-                // same length and lexicographically smaller
-                || (str.size() == maxInt64String.size() && str <= maxInt64String)
-            )
-        )
-    );
+    const char* p = str.begin();
+    const char* end = str.end();
+    bool isNegative = *p == '-';
+    p += isNegative;
+    size_t nDigits = end - p;
+    if (nDigits > 19) {
+        return false; // too long for int64 -- or it has a "." or "e"
+    }
+
+    // 19 digits always fit in uint64_t: no overflow until the end
+    uint64_t u = 0;
+    for (; end - p >= 8; p += 8) {
+        uint64_t chunk;
+        memcpy(&chunk, p, 8);
+#if __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+        chunk = __builtin_bswap64(chunk);
+#endif
+        if (!isEightDigits(chunk)) {
+            return false; // "." or "e"
+        }
+        u = u * 100000000 + parseEightDigits(chunk);
+    }
+    for (; p < end; p++) {
+        uint8_t digit = *p - '0';
+        if (digit > 9) {
+            return false; // "." or "e"
+        }
+        u = u * 10 + digit;
+    }
+
+    // magic numbers differ for negative and positive numbers
+    uint64_t max = static_cast<uint64_t>(std::numeric_limits<int64_t>::max()) + isNegative;
+    if (u > max) {
+        return false;
+    }
+    *value = isNegative ? static_cast<int64_t>(0 - u) : static_cast<int64_t>(u);
+    return true;
 }
 
 
@@ -156,10 +197,9 @@ ColumnBuilder::writeNumber(int64_t row, std::string_view str)
     storeStringValue(row, str, this->stringBuilder);
     this->nNumbers++;
 
-    if (canParseJsonNumberAsInt64(str)) {
-        int64_t value = 0; // 0 to avoid uninitialized-value compiler warning
-        std::from_chars(str.begin(), str.end(), value); // Guaranteed success
-        this->writeInt64(row, value);
+    int64_t intValue;
+    if (parseJsonNumberAsInt64(str, &intValue)) {
+        this->writeInt64(row, intValue);
     } else {
         // [2019-11-28] GCC 8.3.0 std::from_chars() does not convert doubles
         // use Google double-conversion library instead
@@ -8,13 +8,12 @@ DECLARE_uint32(max_columns);
 TableBuilder::FoundColumnOrNull
 TableBuilder::findOrCreateColumnOrNull(int64_t row, std::string_view name, Warnings& warnings)
 {
-    auto iter = this->lookup.find(name);
-    if (iter == this->lookup.end()) {
-        // not found
+    ColumnBuilder** found = this->lookup.find(name);
+    if (found == nullptr) {
         ColumnBuilder* column = this->createColumnOrNull(row, name, warnings);
         return { column, column ? true : false };
     } else {
-        return { iter->second, false };
+        return { *found, false };
     }
 }
 
@@ -34,7 +33,8 @@ TableBuilder::createColumnOrNull(int64_t row, std::string_view name, Warnings& w
     ColumnBuilder* ret(builder.get());
 
     this->columnBuilders.emplace_back(std::move(builder));
-    this->lookup[name] = ret;
+    // Key on ret->name, not `name`: the caller may reuse `name`'s bytes.
+    this->lookup.insert(ret->name, ret);
     return ret;
 }
 
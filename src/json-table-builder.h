@@ -3,12 +3,12 @@
 
 #include <memory>
 #include <string_view>
-#include <unordered_map>
 #include <vector>
 
 #include <arrow/api.h>
 
 #include "column-builder.h"
+#include "string-view-hash-map.h"
 
 
 class Warnings;
@@ -31,11 +31,14 @@ public:
     std::shared_ptr<arrow::Table> finish(size_t nRows, Warnings& warnings);
 
 private:
-    // Chose an unordered_map because in the worst case we have a few hundred
-    // keys.... and unordered_map should be quickest in that worst case. See
-    // https://playfulprogramming.blogspot.com/2017/08/performance-of-flat-maps.html
+    // We look up a column for every key of every record, so lookups must be
+    // quick even with a few hundred columns. StringViewHashMap usually finds
+    // a key with one 16-tag SSE2 probe and one memcmp.
+    //
+    // Keys point to each ColumnBuilder's `name`, which lives as long as the
+    // ColumnBuilder.
     std::vector<std::unique_ptr<ColumnBuilder>> columnBuilders;
-    std::unordered_map<std::string_view, ColumnBuilder*> lookup;
+    StringViewHashMap<ColumnBuilder*> lookup;
 
     ColumnBuilder* createColumnOrNull(int64_t row, std::string_view name, Warnings& warnings);
 };
@@ -254,12 +254,14 @@ struct JsonHandler : rapidjson::BaseReaderHandler<rapidjson::UTF8<uint8_t>> {
                         this->appendCommaAndExpectFutureCommaIfWeAreSerializing(this->valueBuf);
                         this->valueBuf.appendAsJsonQuotedString(str, len);
                     } else {
-                        // Use valueBuf to truncate the string
-                        this->valueBuf.append(str, len);
-                        if (this->valueBuf.hasOverflow()) {
+                        // Truncate rapidjson's bytes in place: no need to
+                        // copy them into valueBuf first.
+                        std::string_view sv(reinterpret_cast<const char*>(str), len);
+                        if (len > FLAGS_max_bytes_per_value) {
                             this->warnings.warnValueTruncated(this->row, this->column->name);
+                            sv = sv.substr(0, greatestValidUtf8Length(str, FLAGS_max_bytes_per_value));
                         }
-                        this->finishColumnWithStringValue();
+                        this->finishColumnWithStringValue(sv);
                     }
                 }
                 break;
@@ -541,7 +543,11 @@ struct JsonHandler : rapidjson::BaseReaderHandler<rapidjson::UTF8<uint8_t>> {
 private:
     void finishColumnWithStringValue()
     {
-        std::string_view sv(this->valueBuf.toUtf8StringView());
+        this->finishColumnWithStringValue(this->valueBuf.toUtf8StringView());
+    }
+
+    void finishColumnWithStringValue(std::string_view sv)
+    {
         this->nBytesTotal += sv.size();
         if (this->nBytesTotal > FLAGS_max_bytes_total) {
             this->warnings.warnStoppedOutOfMemory();
@@ -4,6 +4,52 @@
 #define LIKELY(x) __builtin_expect((x), 1)
 #define UNLIKELY(x) __builtin_expect((x), 0)
 
+#include <cstdint>
+#include <cstring>
+
+/**
+ * Return the length of the longest prefix of `buf` that doesn't end
+ * mid-character.
+ *
+ * Assumes `buf` is valid UTF-8 that may have been cut at any byte.
+ *
+ * Only the last 4 bytes matter, so we pack them into a register (last byte
+ * lowest) and avoid a byte-by-byte backwards loop: find the last byte that
+ * isn't a continuation byte (0b10xxxxxx), look up how many bytes its
+ * sequence should have, and drop the sequence if it's incomplete.
+ */
+static inline uint32_t
+greatestValidUtf8Length(const uint8_t* buf, uint32_t len)
+{
+    uint32_t tail;
+    if (LIKELY(len >= 4)) {
+        memcpy(&tail, &buf[len - 4], 4);
+#if __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+        tail = __builtin_bswap32(tail);
+#endif
+    } else {
+        tail = 0x80808080; // pretend missing bytes are continuation bytes
+        for (uint32_t i = 0; i < len; i++) {
+            tail = (tail << 8) | buf[i];
+        }
+    }
+
+    // Nonzero bytes are lead bytes (ASCII or 0b11xxxxxx). If all four are
+    // continuation bytes, the input is invalid: pick the first one, whose
+    // expected length (0, below) keeps all bytes.
+    uint32_t leads = ((tail & 0xc0c0c0c0) ^ 0x80808080) | 0x80000000;
+    uint32_t nBytesFromLead = (__builtin_ctz(leads) >> 3) + 1; // 1..4
+    uint8_t lead = tail >> ((nBytesFromLead - 1) * 8);
+
+    // Expected sequence length, indexed by the lead byte's top nibble:
+    // 0x0-0x7 => 1 (ASCII); 0x8-0xb => 0 (continuation); 0xc-0xd => 2;
+    // 0xe => 3; 0xf => 4.
+    static constexpr uint64_t EXPECTED_LENGTHS = 0x4322000011111111;
+    uint32_t expectedLength = (EXPECTED_LENGTHS >> ((lead >> 4) * 4)) & 0xf;
+
+    return expectedLength <= nBytesFromLead ? len : len - nBytesFromLead;
+}
+
 /*
  * A buffer callers may append to infinitely -- but only the first `maxLength`
  * bytes will be stored.
@@ -90,7 +136,7 @@ struct StringBuffer {
 
     uint32_t validUtf8Length() const {
         if (this->pos > this->bytes.size()) {
-            return this->calculateGreatestValidUtf8Length(&this->bytes[0], this->bytes.size());
+            return greatestValidUtf8Length(&this->bytes[0], this->bytes.size());
         } else {
             return this->pos;
         }
@@ -110,50 +156,6 @@ struct StringBuffer {
     std::string_view toRawStringView() const {
         return std::string_view(reinterpret_cast<const char*>(&this->bytes[0]), std::min(this->pos, this->bytes.size()));
     }
-
-private:
-    uint32_t calculateGreatestValidUtf8Length(const uint8_t* buf, uint32_t len) const {
-        if (len == 0) return 0;
-        uint8_t lastByte = buf[len - 1];
-
-        if ((lastByte & 0xc0) == 0xc0) {
-            // Byte fits format 0b11xxxxxx. That means it's the first byte of a
-            // UTF-8 sequence. Drop it.
-            return len - 1;
-        } else if ((lastByte & 0xc0) == 0x80) {
-            // Byte fits format 0b10xxxxxx. That means it's a continuation byte.
-            // Assume valid UTF-8.
-
-            // Since this is valid UTF-8, we know len >= 2
-            char secondLastByte = buf[len - 2];
-
-            if ((secondLastByte & 0xe0) == 0xc0) {
-                // Previous byte fits format 0b110xxxxx (first byte of a 2-byte
-                // sequence). This 2-byte sequence is valid UTF-8. Include it.
-                return len;
-            } else if ((secondLastByte & 0xe0) == 0xe0) {
-                // Byte fits format 0b111xxxxx. That means it's the first byte of a
-                // 3-byte or 4-byte UTF-8 sequence. We're truncating mid-sequence.
-                // Drop this incomplete sequence of bytes.
-                return len - 2;
-            }
-
-            // Since this is valid UTF-8, we know len >= 3
-            char thirdLastByte = buf[len - 3];
-            if ((thirdLastByte & 0xf8) == 0xf0) {
-                // Third-last byte fits format 0b11110xxx (first byte of a 4-byte
-                // sequence). Drop all three bytes.
-                return len - 3;
-            } else {
-                // We're either the 3rd byte of a 3-byte sequence or the 4th byte of a
-                // 4-byte sequence. Good.
-                return len;
-            }
-        } else {
-            // ASCII character
-            return len;
-        }
-    }
 };
 
 #endif  // ARROW_TOOLS_STRING_BUFFER_H_
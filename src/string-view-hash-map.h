@@ -0,0 +1,184 @@
+#ifndef ARROW_TOOLS_STRING_VIEW_HASH_MAP_H_
+#define ARROW_TOOLS_STRING_VIEW_HASH_MAP_H_
+
+#include <cstdint>
+#include <functional>
+#include <string_view>
+#include <utility>
+#include <vector>
+
+#ifdef __SSE2__
+#include <emmintrin.h>
+#endif
+
+/*
+ * Open-addressing hash map from std::string_view to Value, laid out like
+ * Abseil's "SwissTable".
+ *
+ * Every slot has a one-byte control tag: EMPTY, or the low 7 bits of the key's
+ * hash ("H2"). A lookup starts at the slot picked by the rest of the hash
+ * ("H1") and compares 16 tags at a time -- one SSE2 compare+movemask on
+ * x86-64. It only compares key bytes for slots whose tag matches, which is
+ * about one memcmp per lookup.
+ *
+ * There is no erase(): an EMPTY tag in a probed group means the key is absent.
+ *
+ * The map does not own key bytes. Callers must keep each inserted key alive
+ * and unchanged for as long as the map lives.
+ */
+template<typename Value>
+class StringViewHashMap {
+public:
+    explicit StringViewHashMap(size_t expectedSize = 0) : nItems(0)
+    {
+        size_t capacity = GROUP_SIZE;
+        while (capacity * MAX_LOAD_NUMERATOR < expectedSize * MAX_LOAD_DENOMINATOR) {
+            capacity *= 2;
+        }
+        this->allocate(capacity);
+    }
+
+    size_t size() const {
+        return this->nItems;
+    }
+
+    /// Return a pointer to the value stored for `key`, or nullptr.
+    Value* find(std::string_view key)
+    {
+        return this->find(key, hashKey(key));
+    }
+
+    /// Insert `value` for `key`, unless `key` is already present.
+    ///
+    /// Return the stored value and whether it was inserted.
+    std::pair<Value*, bool> insert(std::string_view key, Value value)
+    {
+        uint64_t hash = hashKey(key);
+        Value* found = this->find(key, hash);
+        if (found) {
+            return { found, false };
+        }
+
+        if ((this->nItems + 1) * MAX_LOAD_DENOMINATOR > this->slots.size() * MAX_LOAD_NUMERATOR) {
+            this->grow();
+        }
+        this->nItems++;
+        return { this->insertUnique(hash, key, value), true };
+    }
+
+    void clear()
+    {
+        this->nItems = 0;
+        this->allocate(GROUP_SIZE);
+    }
+
+private:
+    static constexpr size_t GROUP_SIZE = 16;
+    static constexpr uint8_t EMPTY = 0x80;
+    // Grow when more than 7/8 full. Each probe examines GROUP_SIZE slots, so
+    // lookups stay short even at high load.
+    static constexpr size_t MAX_LOAD_NUMERATOR = 7;
+    static constexpr size_t MAX_LOAD_DENOMINATOR = 8;
+
+    struct Slot {
+        std::string_view key;
+        Value value;
+    };
+
+    /// One tag per slot, plus a copy of the first GROUP_SIZE tags at the
+    /// end, so we can load GROUP_SIZE tags from any position without
+    /// wrapping around.
+    std::vector<uint8_t> ctrl;
+    std::vector<Slot> slots; // size is a power of 2, at least GROUP_SIZE
+    size_t nItems;
+
+    Value* find(std::string_view key, uint64_t hash)
+    {
+        size_t mask = this->slots.size() - 1;
+        for (size_t pos = h1(hash) & mask; ; pos = (pos + GROUP_SIZE) & mask) {
+            uint32_t matches = this->matchGroup(pos, h2(hash));
+            while (matches) {
+                size_t i = (pos + __builtin_ctz(matches)) & mask;
+                if (this->slots[i].key == key) {
+                    return &this->slots[i].value;
+                }
+                matches &= matches - 1;
+            }
+            if (this->matchGroup(pos, EMPTY)) {
+                return nullptr;
+            }
+        }
+    }
+
+    static uint64_t hashKey(std::string_view key) {
+        // libstdc++'s is MurmurHash2-64A. (Arrow's XXH3-based hash lives in a
+        // header that Arrow doesn't install.)
+        return std::hash<std::string_view>()(key);
+    }
+
+    static size_t h1(uint64_t hash) {
+        return hash >> 7;
+    }
+
+    static uint8_t h2(uint64_t hash) {
+        return hash & 0x7f;
+    }
+
+    void allocate(size_t capacity)
+    {
+        this->ctrl.assign(capacity + GROUP_SIZE, EMPTY);
+        this->slots.assign(capacity, Slot());
+    }
+
+    void setCtrl(size_t i, uint8_t tag)
+    {
+        this->ctrl[i] = tag;
+        if (i < GROUP_SIZE) {
+            this->ctrl[this->slots.size() + i] = tag;
+        }
+    }
+
+    /// Bitmask of the GROUP_SIZE tags starting at `pos` that equal `tag`.
+    uint32_t matchGroup(size_t pos, uint8_t tag) const
+    {
+        const uint8_t* group = &this->ctrl[pos];
+#ifdef __SSE2__
+        __m128i tags = _mm_loadu_si128(reinterpret_cast<const __m128i*>(group));
+        return _mm_movemask_epi8(_mm_cmpeq_epi8(tags, _mm_set1_epi8(static_cast<char>(tag))));
+#else
+        uint32_t ret = 0;
+        for (size_t i = 0; i < GROUP_SIZE; i++) {
+            ret |= static_cast<uint32_t>(group[i] == tag) << i;
+        }
+        return ret;
+#endif
+    }
+
+    Value* insertUnique(uint64_t hash, std::string_view key, Value value)
+    {
+        size_t mask = this->slots.size() - 1;
+        size_t pos = h1(hash) & mask;
+        uint32_t empties;
+        while (!(empties = this->matchGroup(pos, EMPTY))) {
+            pos = (pos + GROUP_SIZE) & mask;
+        }
+        size_t i = (pos + __builtin_ctz(empties)) & mask;
+        this->setCtrl(i, h2(hash));
+        this->slots[i] = Slot { key, value };
+        return &this->slots[i].value;
+    }
+
+    void grow()
+    {
+        std::vector<Slot> oldSlots(std::move(this->slots));
+        std::vector<uint8_t> oldCtrl(std::move(this->ctrl));
+        this->allocate(oldSlots.size() * 2);
+        for (size_t i = 0; i < oldSlots.size(); i++) {
+            if (oldCtrl[i] != EMPTY) {
+                this->insertUnique(hashKey(oldSlots[i].key), oldSlots[i].key, oldSlots[i].value);
+            }
+        }
+    }
+};
+
+#endif  // ARROW_TOOLS_STRING_VIEW_HASH_MAP_H_
@@ -0,0 +1,27 @@
+import os
+import shutil
+import tempfile
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memory_backed_tempdir():
+    """Write temp files to tmpfs, when there is one.
+
+    Every test writes a few small files and hands them to a subprocess. On
+    tmpfs those writes never touch disk.
+    """
+    if not os.path.isdir("/dev/shm"):
+        yield
+        return
+
+    # Under pytest-xdist, each worker gets its own directory
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    tempdir = tempfile.mkdtemp(prefix=f"arrow-tools-tests-{worker}-", dir="/dev/shm")
+    old_tempdir = tempfile.tempdir
+    tempfile.tempdir = tempdir
+    try:
+        yield
+    finally:
+        tempfile.tempdir = old_tempdir
+        shutil.rmtree(tempdir, ignore_errors=True)
@@ -7,7 +7,7 @@ from typing import Dict, Optional, Tuple
 import numpy as np
 import pyarrow as pa
 
-from .util import arrow_file
+from .util import arrow_file, binary_path
 
 ALL_CHECKS = {
     "safe": True,
@@ -26,7 +26,7 @@ def validate(
     """
     arrow-validate with `checks`; return None on exit=0, (stdout, stderr) otherwise.
     """
-    args = ["/usr/bin/arrow-validate", arrow_path]
+    args = [binary_path("arrow-validate"), arrow_path]
     for check, value in checks.items():
         if isinstance(value, bool):
             if value:
@@ -133,6 +133,15 @@ def test_check_column_name_control_characters_invalid():
         )
 
 
+def test_check_column_name_control_characters_invalid_without_record_batches():
+    table = pa.Table.from_batches([], pa.schema([("a\nb", pa.int64())]))
+    with arrow_file(table) as path:
+        assert validate(path, {"column-name-control-characters": True}) == (
+            "--check-column-name-control-characters failed on a column name\n",
+            "",
+        )
+
+
 def test_check_column_name_max_length():
     table = pa.table({"ABCDEFGHIJKLMNOP": [1, 2]})
     with arrow_file(table) as path:
@@ -169,6 +178,21 @@ def test_dictionary_values_all_used_invalid():
         )
 
 
+def test_dictionary_values_all_used_last_value_unused_invalid():
+    table = pa.table(
+        {
+            "A": pa.DictionaryArray.from_arrays(
+                pa.array([0, 1, 1], pa.int32()), pa.array(["A", "B", "C"])
+            )
+        }
+    )
+    with arrow_file(table) as path:
+        assert validate(path, {"dictionary-values-all-used": True}) == (
+            "--check-dictionary-values-all-used failed on column A\n",
+            "",
+        )
+
+
 def test_dictionary_values_all_used_all_null_indices_valid():
     table = pa.table(
         {
@@ -250,6 +274,21 @@ def test_dictionary_values_unique_invalid():
         )
 
 
+def test_dictionary_values_unique_two_nulls_invalid():
+    table = pa.table(
+        {
+            "A": pa.DictionaryArray.from_arrays(
+                pa.array([0, 1, 2], pa.int32()), pa.array(["A", None, None])
+            )
+        }
+    )
+    with arrow_file(table) as path:
+        assert validate(path, {"dictionary-values-unique": True}) == (
+            "--check-dictionary-values-unique failed on column A\n",
+            "",
+        )
+
+
 def test_check_empty_data_string_array():
     with arrow_file(pa.table({"A": ["", "", ""]})) as path:
         assert validate(path, ALL_CHECKS) is None
@@ -298,6 +337,23 @@ def test_floats_all_finite_null_is_valid():
         assert validate(path, ALL_CHECKS) is None
 
 
+def test_floats_all_finite_nan_in_null_slot_is_valid():
+    array = pa.Array.from_buffers(
+        pa.float64(),
+        2,
+        [
+            # validity: only the first value is non-null
+            pa.py_buffer(b"\x01"),
+            # data: the null slot holds NaN
+            pa.py_buffer(struct.pack("dd", 1.0, math.nan)),
+        ],
+        null_count=1,
+    )
+    table = pa.table({"A": array})
+    with arrow_file(table) as path:
+        assert validate(path, ALL_CHECKS) is None
+
+
 def test_floats_all_finite_nan_is_invalid():
     table = pa.table({"A": pa.array([1.0, -2.1, math.nan])})
     with arrow_file(table) as path:
@@ -316,6 +372,15 @@ def test_floats_all_finite_infinity_is_invalid():
         )
 
 
+def test_floats_all_finite_float16_nan_is_invalid():
+    table = pa.table({"A": pa.array([np.float16("nan")], pa.float16())})
+    with arrow_file(table) as path:
+        assert validate(path, {"floats-all-finite": True}) == (
+            "--check-floats-all-finite failed on column A\n",
+            "",
+        )
+
+
 def test_timestamp():
     table = pa.table({"date64": pa.array([1231241234, 235234234], pa.timestamp("s"))})
     with arrow_file(table) as path:
@@ -4,7 +4,7 @@ import tempfile
 import textwrap
 from typing import Tuple
 import pyarrow
-from .util import assert_table_equals, empty_file
+from .util import assert_table_equals, binary_path, read_arrow_file, temp_path
 
 
 def do_convert(
@@ -18,7 +18,7 @@ def do_convert(
 ) -> Tuple[pyarrow.Table, bytes]:
     with tempfile.NamedTemporaryFile(suffix=".arrow") as arrow_file:
         args = [
-            "/usr/bin/csv-to-arrow",
+            binary_path("csv-to-arrow"),
             "--delimiter",
             delimiter,
             "--max-rows",
@@ -48,8 +48,7 @@ def do_convert(
             ) from None
 
         assert result.stderr == b""
-        result_reader = pyarrow.ipc.open_file(arrow_file.name)
-        table = result_reader.read_all()
+        table = read_arrow_file(arrow_file.name)
         if include_stdout:
             return table, result.stdout
         else:
@@ -57,8 +56,7 @@ def do_convert(
 
 
 def do_convert_dedented_utf8_csv(csv_text: str, **kwargs):
-    with empty_file(suffix=".csv") as csv_file:
-        csv_path = Path(csv_file.name)
+    with temp_path(suffix=".csv") as csv_path:
         csv_path.write_text(textwrap.dedent(csv_text))
         return do_convert(csv_path, **kwargs)
 
@@ -300,7 +298,7 @@ def test_truncate_values():
 
 
 def test_truncate_do_not_cause_invalid_utf8():
-    with empty_file(suffix=".csv") as csv_path:
+    with temp_path(suffix=".csv") as csv_path:
         csv_path.write_bytes(
             "\n".join(
                 [
@@ -4,7 +4,7 @@ import subprocess
 import tempfile
 from typing import Tuple, Union
 import pyarrow
-from .util import assert_table_equals
+from .util import assert_table_equals, binary_path, read_arrow_file
 
 
 def do_convert(
@@ -20,7 +20,7 @@ def do_convert(
 ) -> Union[pyarrow.Table, Tuple[pyarrow.Table, bytes]]:
     with tempfile.NamedTemporaryFile(suffix=".arrow") as arrow_file:
         args = [
-            "/usr/bin/json-to-arrow",
+            binary_path("json-to-arrow"),
             "--max-rows",
             str(max_rows),
             "--max-columns",
@@ -54,8 +54,7 @@ def do_convert(
             ) from None
 
         assert result.stderr == b""
-        result_reader = pyarrow.ipc.open_file(arrow_file.name)
-        table = result_reader.read_all()
+        table = read_arrow_file(arrow_file.name)
         if include_stdout:
             return table, result.stdout
         else:
@@ -111,6 +110,33 @@ def test_int64():
     )
 
 
+def test_int64_min_and_max():
+    assert_table_equals(
+        do_convert_data('[{"x": 9223372036854775807}, {"x": -9223372036854775808}]'),
+        pyarrow.table(
+            {
+                "x": pyarrow.array(
+                    [9223372036854775807, -9223372036854775808], pyarrow.int64()
+                )
+            }
+        ),
+    )
+
+
+def test_int64_overflow_becomes_float():
+    assert_table_equals(
+        do_convert_data('[{"x": 9223372036854775808}, {"x": -9223372036854775809}]'),
+        pyarrow.table(
+            {
+                "x": pyarrow.array(
+                    [float(9223372036854775808), float(-9223372036854775809)],
+                    pyarrow.float64(),
+                )
+            }
+        ),
+    )
+
+
 def test_float():
     assert_table_equals(
         do_convert_data('[{"x": 1.1}, {"x": -2.2}, {"x": 3.3}]'),
@@ -141,6 +167,25 @@ def test_convert_int_to_float():
     )
 
 
+def test_convert_int_to_float_with_null():
+    assert_table_equals(
+        do_convert_data('[{"x": 1}, {"x": null}, {"x": 2.5}]'),
+        pyarrow.table({"x": pyarrow.array([1.0, None, 2.5], pyarrow.float64())}),
+    )
+
+
+def test_convert_int_to_float_with_missing_leading_value():
+    assert_table_equals(
+        do_convert_data('[{"y": 1}, {"x": 1}, {"x": 2.5}]'),
+        pyarrow.table(
+            {
+                "y": pyarrow.array([1, None, None], pyarrow.int8()),
+                "x": pyarrow.array([None, 1.0, 2.5], pyarrow.float64()),
+            }
+        ),
+    )
+
+
 def test_int_column_with_null():
     assert_table_equals(
         do_convert_data('[{"x": 1}, {"x": null}, {"x": 2}]'),
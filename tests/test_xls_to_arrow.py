@@ -5,9 +5,10 @@ from pathlib import Path
 from typing import Tuple, Union
 
 import pyarrow
+import pytest
 import xlwt as xl
 
-from .util import assert_table_equals
+from .util import assert_table_equals, binary_path, read_arrow_file
 
 
 def do_convert(
@@ -23,7 +24,7 @@ def do_convert(
 ) -> Union[pyarrow.Table, Tuple[pyarrow.Table, bytes]]:
     with tempfile.NamedTemporaryFile(suffix=".arrow") as arrow_file:
         args = [
-            "/usr/bin/xls-to-arrow",
+            binary_path("xls-to-arrow"),
             "--max-rows",
             str(max_rows),
             "--max-columns",
@@ -57,8 +58,7 @@ def do_convert(
             ) from None
 
         assert result.stderr == b""
-        result_reader = pyarrow.ipc.open_file(arrow_file.name)
-        table = result_reader.read_all()
+        table = read_arrow_file(arrow_file.name)
         if include_stdout:
             return table, result.stdout
         else:
@@ -248,10 +248,8 @@ def test_bool_becomes_str():
     sheet.write(0, 0, True)
     sheet.write(1, 0, False)
     result, stdout = do_convert_data(workbook, header_rows="", include_stdout=True)
-    assert_table_equals(
-        do_convert_data(workbook, header_rows=""),
-        pyarrow.table({"A": ["TRUE", "FALSE"]}),
-    )
+    assert_table_equals(result, pyarrow.table({"A": ["TRUE", "FALSE"]}))
+    assert stdout == b""
 
 
 def test_invalid_xls_file():
@@ -380,50 +378,75 @@ def test_values_truncated():
     assert stdout == b"truncated 2 values (value byte limit is 3; see row 0 column A)\n"
 
 
-def test_truncate_do_not_cause_invalid_utf8():
+TRUNCATE_UTF8_VALUES = [
+    # Examples from https://en.wikipedia.org/wiki/UTF-8
+    "AAAA",
+    "AA\u00A2",  # ¢ (2 bytes)
+    "AAA\u00A2",  # ¢ (2 bytes)
+    "A\u0939",  # ह (3 bytes)
+    "AA\u0939",  # ह (3 bytes)
+    "AAA\u0939",  # ह (3 bytes)
+    "\U00010348",  # 𐍈 (4 bytes)
+    "A\U00010348",  # 𐍈 (4 bytes)
+    "AA\U00010348",  # 𐍈 (4 bytes)
+    "AAA\U00010348",  # 𐍈 (4 bytes)
+]
+
+
+@pytest.mark.parametrize(
+    "max_bytes_per_value,expected_values,expected_stdout",
+    [
+        (
+            4,
+            [
+                "AAAA",
+                "AA\u00A2",  # keep
+                "AAA",  # drop both bytes
+                "A\u0939",  # keep
+                "AA",  # drop all three bytes
+                "AAA",  # drop all three bytes
+                "\U00010348",  # keep
+                "A",  # drop all four bytes
+                "AA",  # drop all four bytes
+                "AAA",  # drop all four bytes
+            ],
+            b"truncated 6 values (value byte limit is 4; see row 2 column A)\n",
+        ),
+        (
+            # Shorter than the longest UTF-8 sequence
+            3,
+            [
+                "AAA",
+                "AA",  # drop both bytes
+                "AAA",  # drop both bytes
+                "A",  # drop all three bytes
+                "AA",  # drop all three bytes
+                "AAA",  # drop all three bytes
+                "",  # drop all four bytes
+                "A",  # drop all four bytes
+                "AA",  # drop all four bytes
+                "AAA",  # drop all four bytes
+            ],
+            b"truncated 10 values (value byte limit is 3; see row 0 column A)\n",
+        ),
+    ],
+)
+def test_truncate_do_not_cause_invalid_utf8(
+    max_bytes_per_value, expected_values, expected_stdout
+):
     workbook = xl.Workbook()
     sheet = workbook.add_sheet("X")
-    for i, s in enumerate(
-        [
-            # Examples from https://en.wikipedia.org/wiki/UTF-8
-            "AAAA",
-            "AA\u00A2",  # ¢ (2 bytes) -- keep
-            "AAA\u00A2",  # ¢ (2 bytes) -- drop both bytes
-            "A\u0939",  # ह (3 bytes) -- keep
-            "AA\u0939",  # ह (3 bytes) -- drop all three bytes
-            "AAA\u0939",  # ह (3 bytes) -- drop all three bytes
-            "\U00010348",  # 𐍈 (4 bytes) -- keep
-            "A\U00010348",  # 𐍈 (4 bytes) -- drop all four bytes
-            "AA\U00010348",  # 𐍈 (4 bytes) -- drop all four bytes
-            "AAA\U00010348",  # 𐍈 (4 bytes) -- drop all four bytes
-        ]
-    ):
+    for i, s in enumerate(TRUNCATE_UTF8_VALUES):
         sheet.write(i, 0, s)
 
     result, stdout = do_convert_data(
         workbook,
-        max_bytes_per_value=4,
+        max_bytes_per_value=max_bytes_per_value,
         header_rows="",
         include_stdout=True,
     )
-    expected = pyarrow.table(
-        {
-            "A": [
-                "AAAA",
-                "AA\u00A2",
-                "AAA",
-                "A\u0939",
-                "AA",
-                "AAA",
-                "\U00010348",
-                "A",
-                "AA",
-                "AAA",
-            ]
-        }
-    )
-    assert_table_equals(result, expected)
-    assert stdout == b"truncated 6 values (value byte limit is 4; see row 2 column A)\n"
+    assert_table_equals(result, pyarrow.table({"A": expected_values}))
+    assert stdout == expected_stdout
 
 
 def test_convert_float_to_string_and_report():
@@ -5,7 +5,7 @@ import tempfile
 from typing import Tuple, Union
 import openpyxl as xl
 import pyarrow
-from .util import assert_table_equals
+from .util import assert_table_equals, binary_path, read_arrow_file
 
 
 def do_convert(
@@ -21,7 +21,7 @@ def do_convert(
 ) -> Union[pyarrow.Table, Tuple[pyarrow.Table, bytes]]:
     with tempfile.NamedTemporaryFile(suffix=".arrow") as arrow_file:
         args = [
-            "/usr/bin/xlsx-to-arrow",
+            binary_path("xlsx-to-arrow"),
             "--max-rows",
             str(max_rows),
             "--max-columns",
@@ -55,8 +55,7 @@ def do_convert(
             ) from None
 
         assert result.stderr == b""
-        with pyarrow.ipc.open_file(arrow_file.name) as result_reader:
-            table = result_reader.read_all()
+        table = read_arrow_file(arrow_file.name)
         if include_stdout:
             return table, result.stdout
         else:
@@ -64,6 +63,8 @@ def do_convert(
             return table
 
 
+# Tests build workbooks in openpyxl's write-only mode, which streams rows to
+# XML. Tests that set cells by coordinate or set number_format use normal mode.
 def do_convert_data(
     workbook: xl.Workbook, **kwargs
 ) -> Union[pyarrow.Table, Union[pyarrow.Table, str]]:
@@ -85,18 +86,20 @@ def do_convert_data(
 
 
 def test_empty_sheet():
-    workbook = xl.Workbook()
+    workbook = xl.Workbook(write_only=True)
+    workbook.create_sheet()
     assert_table_equals(do_convert_data(workbook, header_rows=""), pyarrow.table({}))
 
 
 def test_empty_sheet_no_header_row():
-    workbook = xl.Workbook()
+    workbook = xl.Workbook(write_only=True)
+    workbook.create_sheet()
     assert_table_equals(do_convert_data(workbook, header_rows="0-1"), pyarrow.table({}))
 
 
 def test_number_columns():
-    workbook = xl.Workbook()
-    sheet = workbook.active
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     sheet.append([1, 1.1])
     sheet.append([2, 2.2])
     sheet.append([3, 3.3])
@@ -119,8 +122,8 @@ def test_number_columns():
 
 
 def test_inline_str_column():
-    workbook = xl.Workbook()
-    sheet = workbook.active
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     sheet.append(["a"])
     sheet.append(["b"])
     assert_table_equals(
@@ -129,8 +132,8 @@ def test_inline_str_column():
 
 
 def test_date_and_datetime_columns():
-    workbook = xl.Workbook()
-    sheet = workbook.active
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     # These dates are chosen specially -- double precision can't represent
     # every arbitrary number of microseconds accurately (let alone
     # nanoseconds), but the math happens to work for these datetimes.
@@ -163,8 +166,8 @@ def test_date_and_datetime_columns():
 
 
 def test_datetime_overflow():
-    workbook = xl.Workbook()
-    sheet = workbook.active
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     sheet.append([datetime.date(1100, 1, 1), datetime.date(1901, 1, 1)])
     sheet.append([datetime.date(1901, 1, 1), datetime.date(3000, 1, 1)])
     result, stdout = do_convert_data(workbook, include_stdout=True, header_rows="")
@@ -270,15 +273,13 @@ def test_backfill_column_at_end():
 
 
 def test_bool_becomes_str():
-    workbook = xl.Workbook()
-    sheet = workbook.active
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     sheet.append([True])
     sheet.append([False])
     result, stdout = do_convert_data(workbook, header_rows="", include_stdout=True)
-    assert_table_equals(
-        do_convert_data(workbook, header_rows=""),
-        pyarrow.table({"A": ["TRUE", "FALSE"]}),
-    )
+    assert_table_equals(result, pyarrow.table({"A": ["TRUE", "FALSE"]}))
+    assert stdout == b""
 
 
 def test_invalid_zipfile():
@@ -355,8 +356,8 @@ def test_header_rows_convert_to_str():
 
 
 def test_header_rows():
-    workbook = xl.Workbook()
-    sheet = workbook.active
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     sheet.append(["ColA", "ColB"])
     sheet.append(["a", "b"])
     with tempfile.NamedTemporaryFile(suffix="-headers.arrow") as header_file:
@@ -370,8 +371,8 @@ def test_header_rows():
 
 
 def test_header_truncated():
-    workbook = xl.Workbook()
-    sheet = workbook.active
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     sheet.append(["xy1", "xy2"])
     sheet.append(["a", "b"])
     with tempfile.NamedTemporaryFile(suffix="-headers.arrow") as header_file:
@@ -392,8 +393,8 @@ def test_header_truncated():
 
 
 def test_values_truncated():
-    workbook = xl.Workbook()
-    workbook.active.append(["abcde", "fghijklmn", "opq"])
+    workbook = xl.Workbook(write_only=True)
+    workbook.create_sheet().append(["abcde", "fghijklmn", "opq"])
     result, stdout = do_convert_data(
         workbook,
         max_bytes_per_value=3,
@@ -407,7 +408,8 @@ def test_values_truncated():
 
 
 def test_truncate_do_not_cause_invalid_utf8():
-    workbook = xl.Workbook()
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
     for s in [
         # Examples from https://en.wikipedia.org/wiki/UTF-8
         "AAAA",
@@ -421,7 +423,7 @@ def test_truncate_do_not_cause_invalid_utf8():
         "AA\U00010348",  # 𐍈 (4 bytes) -- drop all four bytes
         "AAA\U00010348",  # 𐍈 (4 bytes) -- drop all four bytes
     ]:
-        workbook.active.append([s])
+        sheet.append([s])
 
     result, stdout = do_convert_data(
         workbook,
@@ -500,9 +502,10 @@ def test_float_convert_to_string_preserve_previously_ignored_whitespace():
 
 
 def test_stop_after_byte_total_limit():
-    workbook = xl.Workbook()
-    workbook.active.append(["abcd", "efgh"])
-    workbook.active.append(["ijkl", "mnop"])
+    workbook = xl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["abcd", "efgh"])
+    sheet.append(["ijkl", "mnop"])
     result, stdout = do_convert_data(
         workbook,
         max_bytes_total=8,
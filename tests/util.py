@@ -1,63 +1,103 @@
-from contextlib import contextmanager, suppress
+import atexit
+from contextlib import contextmanager
+import itertools
 import pathlib
 import os
+import shutil
 import tempfile
-from typing import ContextManager
-import unittest
+from typing import ContextManager, Optional, Union
 from pandas.testing import assert_series_equal
 import pyarrow
 
 
-def assert_table_equals(actual: pyarrow.Table, expected: pyarrow.Table) -> None:
-    assertEqual = unittest.TestCase().assertEqual
-    assertEqual(actual.num_rows, expected.num_rows)
-    assertEqual(actual.num_columns, expected.num_columns)
-
-    for (
-        column_number,
-        actual_name,
-        actual_column,
-        expected_name,
-        expected_column,
-    ) in zip(
-        range(actual.num_columns),
-        actual.column_names,
-        actual.columns,
-        expected.column_names,
-        expected.columns,
-    ):
-        assertEqual(
-            actual_name, expected_name, f"column {column_number} has wrong name"
+def binary_path(name: str) -> str:
+    """Path to the `name` executable: in $ARROW_TOOLS_BIN_DIR, or /usr/bin."""
+    return os.path.join(os.environ.get("ARROW_TOOLS_BIN_DIR", "/usr/bin"), name)
+
+
+def _column_to_series(column: pyarrow.ChunkedArray):
+    """Convert to pandas -- without copying, for null-free numeric columns."""
+    if (
+        column.num_chunks > 0
+        and column.null_count == 0
+        and (
+            pyarrow.types.is_integer(column.type)
+            or pyarrow.types.is_floating(column.type)
         )
-        assertEqual(
-            actual_column.type,
-            expected_column.type,
-            f"column {actual_name} has wrong type",
+    ):
+        # Combine into one contiguous array, which pandas can wrap. (Only
+        # here: pyarrow 0.16 can't concatenate differing dictionaries.)
+        array = pyarrow.concat_arrays(column.chunks)
+        return array.to_pandas(zero_copy_only=True)
+    return column.to_pandas()
+
+
+def assert_table_equals(actual: pyarrow.Table, expected: pyarrow.Table) -> None:
+    if actual.equals(expected):
+        return  # fast path; otherwise, compare piece by piece to explain why
+
+    # Names and types -- not nullability or metadata. DataType.equals() is
+    # one C++ call per field.
+    assert actual.schema.names == expected.schema.names and all(
+        actual_type.equals(expected_type)
+        for actual_type, expected_type in zip(
+            actual.schema.types, expected.schema.types
         )
-        actual_data = actual_column.to_pandas()
-        expected_data = expected_column.to_pandas()
+    ), f"wrong schema:\n{actual.schema}\nexpected:\n{expected.schema}"
+    assert (
+        actual.num_rows == expected.num_rows
+    ), f"wrong number of rows: {actual.num_rows} != {expected.num_rows}"
+
+    for i in range(actual.num_columns):
+        actual_column = actual.column(i)
+        expected_column = expected.column(i)
+        if actual_column.equals(expected_column):
+            continue  # skip slow to_pandas() conversion
+        actual_data = _column_to_series(actual_column)
+        expected_data = _column_to_series(expected_column)
         assert_series_equal(
-            actual_data, expected_data, f"column {actual_name} has wrong data"
+            actual_data,
+            expected_data,
+            f"column {actual.column_names[i]} has wrong data",
         )
 
 
+def read_arrow_file(path: Union[str, pathlib.Path]) -> pyarrow.Table:
+    """Read an Arrow file, memory-mapped.
+
+    The table's buffers point into the file instead of copies.
+    """
+    with pyarrow.memory_map(str(path), "r") as source:
+        return pyarrow.ipc.open_file(source).read_all()
+
+
+_temp_path_dir: Optional[pathlib.Path] = None
+_temp_path_counter = itertools.count()
+
+
 @contextmanager
-def empty_file(suffix: str = "") -> ContextManager[pathlib.Path]:
-    """Yield a path that will be deleted when exiting the context."""
-    fd, filename = tempfile.mkstemp(suffix=suffix)
-    try:
-        os.close(fd)
-        yield pathlib.Path(filename)
-    finally:
-        with suppress(FileNotFoundError):
-            os.unlink(filename)
+def temp_path(suffix: str = "") -> ContextManager[pathlib.Path]:
+    """Yield a path, to be deleted when the test process exits.
+
+    The file does not exist yet: the caller creates it. Paths are numbered
+    within a private per-process directory, so there's no need to pick a
+    random name and create a file to reserve it -- or to delete each file
+    right away, since no path is ever reused.
+    """
+    global _temp_path_dir
+    if _temp_path_dir is None:
+        # Create lazily, within the tempdir chosen by conftest.py
+        _temp_path_dir = pathlib.Path(tempfile.mkdtemp(prefix="arrow-tools-"))
+        atexit.register(shutil.rmtree, _temp_path_dir, ignore_errors=True)
+
+    yield _temp_path_dir / f"{next(_temp_path_counter)}{suffix}"
 
 
 @contextmanager
 def arrow_file(table: pyarrow.Table) -> ContextManager[pathlib.Path]:
-    with empty_file(suffix=".arrow") as path:
-        with path.open("wb") as f:
-            writer = pyarrow.RecordBatchFileWriter(f, table.schema)
-            writer.write(table)
-            writer.close()
+    with temp_path(suffix=".arrow") as path:
+        # OSFile: Arrow writes buffers straight to the fd, not via Python I/O
+        with pyarrow.OSFile(str(path), "wb") as sink:
+            with pyarrow.RecordBatchFileWriter(sink, table.schema) as writer:
+                writer.write_table(table)
         yield path